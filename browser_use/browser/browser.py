@@ -54,11 +54,19 @@ class Browser:
     It is recommended to use only one instance of Browser per your application (RAM usage will grow otherwise).
     """
     
-    def __init__(self, config: BrowserConfig):
-        """Initializing new browser"""
+    def __init__(self, config: BrowserConfig, playwright: Playwright | None = None):
+        """
+        Initializing new browser
+
+        Args:
+            config: Configuration for the browser
+            playwright: Optional already started Playwright instance to launch from.
+                The caller keeps ownership of it, so close() will not stop it.
+        """
         logger.debug('Initializing new browser')
         self.config = config
-        self.playwright = None
+        self.playwright = playwright
+        self._owns_playwright = playwright is None
         self.playwright_browser = None
         self.disable_security_args = []
         if self.config.disable_security:
@@ -80,7 +88,9 @@ class Browser:
     
     async def _init(self):
         """Initialize the browser session"""
-        self.playwright = await async_playwright().start()
+        if self.playwright is None:
+            self.playwright = await async_playwright().start()
+            self._owns_playwright = True
         self.playwright_browser = await self._setup_browser(self.playwright)
         return self.playwright_browser
     
@@ -172,7 +182,7 @@ class Browser:
             if self.playwright_browser:
                 await self.playwright_browser.close()
             
-            if self.playwright:
+            if self.playwright and self._owns_playwright:
                 await self.playwright.stop()
         
         except Exception as e:
@@ -180,11 +190,12 @@ class Browser:
         
         finally:
             self.playwright_browser = None
-            self.playwright = None
+            if self._owns_playwright:
+                self.playwright = None
     
     def __del__(self):
         """Async cleanup when object is destroyed"""
-        if self.playwright_browser or self.playwright:
+        if self.playwright_browser or (self.playwright and self._owns_playwright):
             try:
                 loop = asyncio.get_running_loop()
                 if loop.is_running():
@@ -205,6 +205,8 @@ class BrowserContext:
         self.session = None
         self._page_event_handler = None
         self.current_state = None
+        # Reused while the current page stays the same so buildDomTree is compiled once per document
+        self._dom_service = None
 
     async def __aenter__(self):
         """Async context manager entry"""
@@ -265,6 +267,7 @@ class BrowserContext:
             # Dereference everything
             self.session = None
             self._page_event_handler = None
+            self._dom_service = None
 
     def __del__(self):
         """Cleanup when object is destroyed"""
@@ -768,8 +771,9 @@ class BrowserContext:
 
         try:
             await self.remove_highlights()
-            dom_service = DomService(page)
-            content = await dom_service.get_clickable_elements(
+            if self._dom_service is None or self._dom_service.page is not page:
+                self._dom_service = DomService(page)
+            content = await self._dom_service.get_clickable_elements(
                 focus_element=focus_element,
                 viewport_expansion=self.config.viewport_expansion,
                 highlight_elements=self.config.highlight_elements,
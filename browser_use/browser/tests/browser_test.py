@@ -0,0 +1,34 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from browser_use.browser.browser import Browser, BrowserConfig
+
+
+@pytest.fixture
+def playwright():
+    playwright = MagicMock()
+    playwright.chromium.launch = AsyncMock()
+    playwright.stop = AsyncMock()
+    return playwright
+
+
+async def test_injected_playwright_is_used_for_launch(playwright):
+    browser = Browser(config=BrowserConfig(headless=True), playwright=playwright)
+
+    playwright_browser = await browser.get_playwright_browser()
+
+    playwright.chromium.launch.assert_awaited_once()
+    assert playwright_browser is playwright.chromium.launch.return_value
+
+
+async def test_close_leaves_injected_playwright_running(playwright):
+    browser = Browser(config=BrowserConfig(headless=True), playwright=playwright)
+    playwright_browser = await browser.get_playwright_browser()
+
+    await browser.close()
+
+    playwright_browser.close.assert_awaited_once()
+    playwright.stop.assert_not_awaited()
+    assert browser.playwright is playwright
+    assert browser.playwright_browser is None
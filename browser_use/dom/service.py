@@ -1,3 +1,4 @@
+import functools
 import logging
 from datetime import datetime
 from importlib import resources
@@ -8,11 +9,53 @@ from browser_use.dom.views import CoordinateSet, DOMBaseNode, DOMElementNode, DO
 
 logger = logging.getLogger(__name__)
 
+# Invokes the buildDomTree function held in a JSHandle, so it never becomes a page global
+CALL_BUILD_DOM_TREE_JS = '(buildDomTree, args) => buildDomTree(args)'
+
+
+@functools.cache
+def _load_js_code() -> str:
+    """Read buildDomTree.js once per process; call _load_js_code.cache_clear() to force a reload"""
+    return resources.files('browser_use.dom').joinpath('buildDomTree.js').read_text()
+
+
 class DomService:
     def __init__(self, page):
         self.page = page
         self.xpath_cache = {}
-        self.js_code = resources.read_text('browser_use.dom', 'buildDomTree.js')
+        # buildDomTree compiled in the current document, dropped when the main frame navigates
+        self._build_dom_tree_handle = None
+
+    @property
+    def js_code(self) -> str:
+        return _load_js_code()
+
+    async def _get_build_dom_tree_handle(self):
+        if self._build_dom_tree_handle is None:
+            # The outer arrow makes evaluate_handle return the function itself instead of calling it
+            self._build_dom_tree_handle = await self.page.evaluate_handle(f'() => (\n{self.js_code.strip().rstrip(";")}\n)')
+            self.page.on('framenavigated', self._on_frame_navigated)
+        return self._build_dom_tree_handle
+
+    async def _call_build_dom_tree(self, args):
+        build_dom_tree = await self._get_build_dom_tree_handle()
+        try:
+            return await build_dom_tree.evaluate(CALL_BUILD_DOM_TREE_JS, args)
+        except Exception as e:
+            # The document can be replaced before framenavigated reaches us; recompile in the current one and retry once
+            logger.debug('buildDomTree handle failed, recompiling: %s', e)
+            self._drop_build_dom_tree_handle()
+            build_dom_tree = await self._get_build_dom_tree_handle()
+            return await build_dom_tree.evaluate(CALL_BUILD_DOM_TREE_JS, args)
+
+    def _drop_build_dom_tree_handle(self):
+        if self._build_dom_tree_handle is not None:
+            self._build_dom_tree_handle = None
+            self.page.remove_listener('framenavigated', self._on_frame_navigated)
+
+    def _on_frame_navigated(self, frame):
+        if frame == self.page.main_frame:
+            self._drop_build_dom_tree_handle()
     
     async def get_clickable_elements(self, highlight_elements=True, focus_element=-1, viewport_expansion=0):
         element_tree, selector_map = await self._build_dom_tree(highlight_elements, focus_element, viewport_expansion)
@@ -31,8 +74,9 @@ class DomService:
         }
         
         try:
-            eval_page = await self.page.evaluate(self.js_code, args)
+            eval_page = await self._call_build_dom_tree(args)
         except Exception as e:
+            self._drop_build_dom_tree_handle()
             logger.error('Error evaluating JavaScript: %s', e)
             raise
             
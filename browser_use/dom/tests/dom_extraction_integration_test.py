@@ -0,0 +1,60 @@
+import pytest
+
+from browser_use.dom.service import DomService
+from browser_use.dom.views import DOMElementNode
+
+pytestmark = pytest.mark.integration
+
+
+@pytest.fixture(scope='module')
+async def page_cache(shared_context):
+    """Look up a page already navigated to a URL, loading it on first use; pages live for the whole module"""
+    session = await shared_context.get_session()
+    pages = {}
+
+    async def get_page(url):
+        if url not in pages:
+            page = await session.context.new_page()
+            # The fixture pages are static, so the DOM is complete once it has been parsed
+            await page.goto(url, wait_until='domcontentloaded')
+            pages[url] = page
+        return pages[url]
+
+    yield get_page
+
+    for page in pages.values():
+        await page.close()
+
+
+@pytest.fixture
+async def navigated_page(page_cache, http_server, path):
+    page = await page_cache(f'{http_server}/{path}')
+    yield page
+    # Leave the cached page as it was loaded for the next test
+    await page.evaluate('document.getElementById("playwright-highlight-container")?.remove()')
+
+
+class TestDomExtractionIntegration:
+    """Integration tests for DomService against a real browser"""
+
+    # Page served by http_server -> number of interactive elements it contains, all of them inside the viewport
+    TEST_PAGES = [('index.html', 4), ('form.html', 3)]
+    EXPANSIONS = [0, 100, -1]
+
+    @pytest.mark.parametrize('expansion', EXPANSIONS)
+    @pytest.mark.parametrize('path,interactive_count', TEST_PAGES)
+    async def test_real_page_extraction(self, navigated_page, interactive_count, expansion):
+        dom_service = DomService(navigated_page)
+        dom_state = await dom_service.get_clickable_elements(highlight_elements=True, viewport_expansion=expansion)
+
+        element_tree = dom_state.element_tree
+        assert isinstance(element_tree, DOMElementNode)
+
+        body_found = element_tree.tag_name == 'body' or any(
+            isinstance(child, DOMElementNode) and child.tag_name == 'body' for child in element_tree.children
+        )
+        assert body_found
+
+        assert len(dom_state.selector_map) == interactive_count
+        for index, node in dom_state.selector_map.items():
+            assert node.highlight_index == index
@@ -0,0 +1,143 @@
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from browser_use.dom.service import CALL_BUILD_DOM_TREE_JS, DomService
+from browser_use.dom.views import DOMElementNode, DOMState
+
+# Shared by every test; the mocked service hands it out as-is, so tests must not mutate it
+SAMPLE_DIV = DOMElementNode(tag_name='div', xpath='//div', attributes={}, children=[], is_visible=True, highlight_index=1)
+EVAL_PAGE = {'map': {'1': {'tagName': 'body', 'xpath': '/body', 'children': []}}, 'rootId': 1}
+
+
+def _make_recording_mock(record, key_fn=lambda highlight, focus, expansion: expansion):
+    """Stand-in for DomService._build_dom_tree that appends key_fn(args) to record and returns SAMPLE_DIV"""
+
+    async def _build_dom_tree(highlight, focus, expansion):
+        record.append(key_fn(highlight, focus, expansion))
+        return SAMPLE_DIV, {1: SAMPLE_DIV}
+
+    return AsyncMock(side_effect=_build_dom_tree)
+
+
+def make_fake_page(eval_return=2, **attributes):
+    """Bare stand-in for a Playwright page: evaluate() plus whatever attributes a test passes in"""
+    return SimpleNamespace(evaluate=AsyncMock(return_value=eval_return), **attributes)
+
+
+@pytest.fixture
+def mock_page():
+    return make_fake_page()
+
+
+@pytest.fixture
+def mock_dom_service(mock_page):
+    return DomService(mock_page)
+
+
+@pytest.fixture
+def handle_page():
+    """Fake page whose evaluate_handle() yields a handle that always returns EVAL_PAGE; buildDomTree.js is stubbed"""
+    build_dom_tree = SimpleNamespace(evaluate=AsyncMock(return_value=EVAL_PAGE))
+    with patch('browser_use.dom.service._load_js_code', return_value='(args) => buildDomTree(args)'):
+        yield make_fake_page(
+            evaluate_handle=AsyncMock(return_value=build_dom_tree),
+            on=MagicMock(),
+            remove_listener=MagicMock(),
+            main_frame=object(),
+        )
+
+
+class TestDomExtraction:
+    """Unit tests for DomService, backed by a mocked page"""
+
+    async def test_get_clickable_elements_basic(self, mock_dom_service):
+        mock_dom_service._build_dom_tree = _make_recording_mock([])
+
+        dom_state = await mock_dom_service.get_clickable_elements()
+
+        assert isinstance(dom_state, DOMState)
+        assert dom_state.element_tree.tag_name == 'div'
+        assert dom_state.selector_map == {1: dom_state.element_tree}
+
+    async def test_different_viewport_expansions(self, mock_dom_service):
+        viewport_calls = []
+        mock_dom_service._build_dom_tree = _make_recording_mock(viewport_calls)
+
+        expansions = [0, 100, 500, -1]
+        await asyncio.gather(
+            *(mock_dom_service.get_clickable_elements(viewport_expansion=expansion) for expansion in expansions)
+        )
+
+        assert sorted(viewport_calls) == sorted(expansions)
+
+    async def test_highlighting_functionality(self, mock_dom_service):
+        highlight_calls = []
+        mock_dom_service._build_dom_tree = _make_recording_mock(
+            highlight_calls, key_fn=lambda highlight, focus, expansion: (highlight, focus)
+        )
+
+        test_cases = [(True, -1), (False, -1), (True, 1)]
+        await asyncio.gather(
+            *(
+                mock_dom_service.get_clickable_elements(highlight_elements=highlight, focus_element=focus)
+                for highlight, focus in test_cases
+            )
+        )
+
+        assert sorted(highlight_calls) == sorted(test_cases)
+
+    async def test_broken_javascript_evaluation(self, mock_dom_service, mock_page):
+        mock_page.evaluate.return_value = 3
+
+        with pytest.raises(ValueError):
+            await mock_dom_service.get_clickable_elements()
+
+    async def test_build_dom_tree_is_compiled_once_per_document(self, handle_page):
+        dom_service = DomService(handle_page)
+
+        first = await dom_service.get_clickable_elements()
+        second = await dom_service.get_clickable_elements()
+
+        handle_page.evaluate_handle.assert_awaited_once()
+        assert 'buildDomTree(args)' in handle_page.evaluate_handle.await_args.args[0]
+        build_dom_tree = handle_page.evaluate_handle.return_value
+        assert [call.args[0] for call in build_dom_tree.evaluate.await_args_list] == [CALL_BUILD_DOM_TREE_JS] * 2
+        assert first.element_tree.tag_name == second.element_tree.tag_name == 'body'
+
+    async def test_build_dom_tree_handle_is_dropped_on_main_frame_navigation(self, handle_page):
+        dom_service = DomService(handle_page)
+
+        await dom_service.get_clickable_elements()
+        handle_page.on.call_args.args[1](object())  # a child frame navigating keeps the handle
+        await dom_service.get_clickable_elements()
+        handle_page.on.call_args.args[1](handle_page.main_frame)
+        await dom_service.get_clickable_elements()
+
+        assert handle_page.evaluate_handle.await_count == 2
+        handle_page.remove_listener.assert_called_once_with('framenavigated', dom_service._on_frame_navigated)
+
+    async def test_stale_build_dom_tree_handle_is_recompiled_within_the_same_call(self, handle_page):
+        dom_service = DomService(handle_page)
+        build_dom_tree = handle_page.evaluate_handle.return_value
+        build_dom_tree.evaluate.side_effect = [Exception('Execution context was destroyed'), EVAL_PAGE]
+
+        dom_state = await dom_service.get_clickable_elements()
+
+        assert handle_page.evaluate_handle.await_count == 2
+        assert dom_state.element_tree.tag_name == 'body'
+
+    async def test_build_dom_tree_error_is_raised_when_the_retry_fails(self, handle_page):
+        dom_service = DomService(handle_page)
+        build_dom_tree = handle_page.evaluate_handle.return_value
+        build_dom_tree.evaluate.side_effect = [Exception('Execution context was destroyed')] * 2 + [EVAL_PAGE]
+
+        with pytest.raises(Exception, match='Execution context was destroyed'):
+            await dom_service.get_clickable_elements()
+        dom_state = await dom_service.get_clickable_elements()
+
+        # The failed handle is not kept, so the next call compiles a fresh one
+        assert handle_page.evaluate_handle.await_count == 3
+        assert dom_state.element_tree.tag_name == 'body'
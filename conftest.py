@@ -1,6 +1,120 @@
+import functools
 import os
 import sys
+import threading
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from playwright.async_api import async_playwright
 
 project_root = os.path.abspath(os.path.dirname(__file__))
 if project_root not in sys.path:
     sys.path.insert(0, project_root)
+
+from browser_use.browser.browser import Browser, BrowserConfig
+from browser_use.browser.context import BrowserContextConfig
+from browser_use.dom.service import DomService
+
+# Static pages the browser tests load instead of live sites
+PAGES_DIR = os.path.join(project_root, 'browser_use', 'dom', 'tests', 'pages')
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(items):
+    """Treat any test that reaches the real browser fixture as an integration test, marked or not"""
+    for item in items:
+        if 'browser' in getattr(item, 'fixturenames', ()) and item.get_closest_marker('integration') is None:
+            item.add_marker(pytest.mark.integration)
+
+
+@pytest.fixture(scope='session')
+def worker_tmp_path(tmp_path_factory, worker_id):
+    """Scratch directory unique to the current xdist worker (cookies, downloads, profiles)"""
+    return tmp_path_factory.mktemp(f'ud-{worker_id}')
+
+
+@pytest.fixture(scope='session')
+def http_server():
+    """Serve the static pages in PAGES_DIR from a local server; yields its base URL"""
+    handler = functools.partial(SimpleHTTPRequestHandler, directory=PAGES_DIR)
+    with ThreadingHTTPServer(('127.0.0.1', 0), handler) as server:
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        yield f'http://127.0.0.1:{server.server_port}'
+        server.shutdown()
+
+
+@pytest.fixture(scope='session')
+async def playwright_instance():
+    """Single Playwright driver process shared by every browser of the session"""
+    async with async_playwright() as playwright:
+        yield playwright
+
+
+@pytest.fixture(scope='session')
+async def browser_factory(playwright_instance):
+    """Launch browsers on demand and close all of them at the end of the session"""
+    browsers = []
+
+    async def launch(**kwargs):
+        browser = Browser(config=BrowserConfig(**kwargs), playwright=playwright_instance)
+        browsers.append(browser)
+        return browser
+
+    yield launch
+
+    for browser in browsers:
+        await browser.close()
+
+
+@pytest.fixture(scope='session')
+async def browser(browser_factory):
+    """Headless browser shared by every test running on this worker"""
+    return await browser_factory(headless=True)
+
+
+@pytest.fixture(scope='session')
+async def context_factory(browser):
+    """Create fresh contexts on the shared browser; any left open are closed at the end of the session"""
+    contexts = []
+
+    async def new_context(**kwargs):
+        context = await browser.new_context(BrowserContextConfig(**kwargs))
+        contexts.append(context)
+        return context
+
+    yield new_context
+
+    for context in contexts:
+        await context.close()
+
+
+@pytest.fixture(scope='session')
+async def shared_context(context_factory, worker_tmp_path):
+    """Context reused by every test of this worker; tests are isolated by getting their own page"""
+    return await context_factory(
+        cookies_file=str(worker_tmp_path / 'cookies.json'),
+        disable_security=True,
+        wait_for_network_idle_page_load_time=0,
+    )
+
+
+@pytest.fixture
+async def fresh_context(context_factory):
+    """Context of its own, for tests that need cookies and storage no other test has touched"""
+    context = await context_factory(disable_security=True, wait_for_network_idle_page_load_time=0)
+    yield context
+    await context.close()
+
+
+@pytest.fixture
+async def page(shared_context):
+    """New tab in the shared context, closed after the test"""
+    session = await shared_context.get_session()
+    page = await session.context.new_page()
+    yield page
+    await page.close()
+
+
+@pytest.fixture
+def dom_service(page):
+    return DomService(page)